@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Precompile the eeprom package to .mpy bytecode files
+
+Requires the mpy-cross compiler, installable with 'pip install mpy-cross'
+or built from a local MicroPython checkout. Importing .mpy files on the
+device skips source parsing and compilation, lowering import time and
+peak RAM usage. With optimization level 3 asserts and line numbers are
+dropped from the generated bytecode.
+"""
+
+import argparse
+import subprocess
+from pathlib import Path
+
+here = Path(__file__).parent.resolve()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Precompile the eeprom package with mpy-cross')
+    parser.add_argument('--mpy-cross',
+                        default='mpy-cross',
+                        help='Path to the mpy-cross compiler')
+    parser.add_argument('-O',
+                        dest='opt',
+                        type=int,
+                        default=3,
+                        help='Optimization level, default 3')
+    args = parser.parse_args()
+
+    for src in sorted((here / 'eeprom').glob('*.py')):
+        subprocess.run(
+            [args.mpy_cross, '-O{}'.format(args.opt), str(src)],
+            check=True
+        )
+        print('Compiled {} to {}'.
+              format(src.name, src.with_suffix('.mpy').name))
+
+
+if __name__ == '__main__':
+    main()
@@ -33,6 +33,15 @@ SOFTWARE.
 from machine import I2C
 from time import sleep_ms
 
+try:
+    from micropython import const
+except ImportError:
+    def const(x):
+        return x
+
+# inlined at bytecode compile time by MicroPython
+_DEFAULT_ADDR = const(0x50)
+
 
 class _Subscriptable():
     def __getitem__(self, item):
@@ -46,11 +55,29 @@ Optional = _subscriptable
 Union = _subscriptable
 
 
+def _bytes_like(buf: Union[bytes, List[int], str]) -> bytes:
+    """
+    Normalize a buffer to a bytes-like object
+
+    :param      buf:  The buffer to normalize
+    :type       buf:  Union[bytes, List[int], str]
+
+    :returns:   Buffer content as bytes-like object
+    :rtype:     bytes
+    """
+    if isinstance(buf, str):
+        return buf.encode()
+    elif isinstance(buf, (bytes, bytearray, memoryview)):
+        return buf
+
+    return bytes(buf)
+
+
 class EEPROM(object):
     """Driver for AT24Cxx I2C EEPROM"""
 
     def __init__(self,
-                 addr: int = 0x50,
+                 addr: int = _DEFAULT_ADDR,
                  pages: int = 128,
                  bpp: int = 32,
                  i2c: Optional[I2C] = None,
@@ -85,12 +112,33 @@ class EEPROM(object):
             self._pages = pages
             self._bpp = bpp
 
+        # plain attribute, avoids a property lookup in the hot paths
+        self._capacity = self._pages * self._bpp
+
+        # page sizes of AT24Cxx devices are powers of two, which allows
+        # replacing modulo operations with a bitwise AND in the hot paths
+        if self._bpp & (self._bpp - 1) != 0:
+            raise ValueError(
+                "Bytes per page {} is not a power of 2".format(self._bpp)
+            )
+        self._bpp_mask = self._bpp - 1
+
         if i2c is None:
             # default assignment, check the docs
             self._i2c = I2C(0)
         else:
             self._i2c = i2c
 
+        # single shared erase pattern, avoids one allocation per wiped page
+        self._ff_page = b'\xff' * self._bpp
+
+        # shared padding pattern for unknown data in page printouts
+        self._pad_page = b'?' * self._bpp
+
+        # one-slot cache of the last read data, invalidated by writes
+        self._last_read_addr = -1
+        self._last_read_data = b''
+
     @property
     def addr(self) -> int:
         """
@@ -109,7 +157,7 @@ class EEPROM(object):
         :returns:   EEPROM capacity of the EEPROM in bytes
         :rtype:     int
         """
-        return self._pages * self._bpp
+        return self._capacity
 
     @property
     def pages(self) -> int:
@@ -138,7 +186,7 @@ class EEPROM(object):
         :returns:   Number of cells in the EEPROM
         :rtype:     int
         """
-        return self.capacity
+        return self._capacity
 
     def read(self, addr: int, nbytes: int = 1) -> bytes:
         """
@@ -152,19 +200,31 @@ class EEPROM(object):
         :returns:   Data of EEPROM
         :rtype:     bytes
         """
-        if addr > self.capacity or addr < 0:
+        if addr > self._capacity or addr < 0:
             raise ValueError(
                 "Read address {} outside of device address range {}".
-                format(addr, self.capacity)
+                format(addr, self._capacity)
             )
 
-        if addr + nbytes > self.capacity:
+        if addr + nbytes > self._capacity:
             raise ValueError(
                 "Last read address {} outside of device address range {}".
-                format(addr + nbytes, self.capacity)
+                format(addr + nbytes, self._capacity)
             )
 
-        return self._i2c.readfrom_mem(self._addr, addr, nbytes, addrsize=16)
+        # serve the request from the cache if it lies in the last read range
+        cache_offset = addr - self._last_read_addr
+        if (self._last_read_data and cache_offset >= 0 and
+                cache_offset + nbytes <= len(self._last_read_data)):
+            return bytes(
+                self._last_read_data[cache_offset:cache_offset + nbytes]
+            )
+
+        data = self._i2c.readfrom_mem(self._addr, addr, nbytes, addrsize=16)
+        self._last_read_addr = addr
+        self._last_read_data = data
+
+        return data
 
     def write(self, addr: int, buf: Union[bytes, List[int], str]) -> None:
         """
@@ -175,39 +235,43 @@ class EEPROM(object):
         :param      buf:   The buffer to write to the EEPROM
         :type       buf:   Union[bytes, List[int], str]
         """
-        offset = addr % self._bpp
-        partial = 0
+        # normalize before validating, the length of e.g. a str buffer may
+        # differ from the number of bytes actually written to the device
+        buf = _bytes_like(buf)
 
-        if addr > self.capacity or addr < 0:
+        if addr > self._capacity or addr < 0:
             raise ValueError(
                 "Write address {} outside of device address range {}".
-                format(addr, self.capacity)
+                format(addr, self._capacity)
             )
 
-        if addr + len(buf) > self.capacity:
+        if addr + len(buf) > self._capacity:
             raise ValueError(
                 "Last data at {} does not fit into device address range {}".
-                format(addr + len(buf), self.capacity)
+                format(addr + len(buf), self._capacity)
             )
 
-        # partial page write
-        if offset > 0:
-            partial = self._bpp - offset
-            self._i2c.writeto_mem(
-                self._addr, addr, buf[0:partial], addrsize=16
-            )
-            sleep_ms(5)
-            addr += partial
-
-        # full page write
-        for i in range(partial, len(buf), self._bpp):
-            self._i2c.writeto_mem(
-                self._addr,
-                addr + i - partial,
-                buf[i:i + self._bpp],
-                addrsize=16
-            )
+        # a write into the cached range makes the cached data stale
+        if (self._last_read_data and
+                addr < self._last_read_addr + len(self._last_read_data) and
+                addr + len(buf) > self._last_read_addr):
+            self._last_read_addr = -1
+            self._last_read_data = b''
+
+        # one transaction per touched page, sliced without copying the
+        # buffer, with hot attributes bound to fast locals for the loop
+        mv = memoryview(buf)
+        bpp = self._bpp
+        bpp_mask = self._bpp_mask
+        dev_addr = self._addr
+        write_mem = self._i2c.writeto_mem
+        offset = 0
+        while offset < len(buf):
+            chunk = min(bpp - (addr & bpp_mask), len(buf) - offset)
+            write_mem(dev_addr, addr, mv[offset:offset + chunk], addrsize=16)
             sleep_ms(5)
+            addr += chunk
+            offset += chunk
 
     def update(self, addr: int, buf: Union[bytes, List[int], str]) -> None:
         """
@@ -218,27 +282,80 @@ class EEPROM(object):
         :param      buf:   The buffer to write to the EEPROM
         :type       buf:   Union[bytes, List[int], str]
         """
-        for idx, ele in enumerate(buf):
-            this_addr = addr + idx
-
-            if isinstance(ele, int):
-                this_val = ele.to_bytes(1, 'big')
-            else:
-                this_val = str(ele).encode()
-
-            current_value = self.read(addr=this_addr)   # returns bytes
-            if current_value != this_val:
-                self.write(addr=this_addr, buf=this_val)
-            #     print("{}: {} -> {}".
-            #           format(this_addr, current_value, this_val))
-            # else:
-            #     print("No need to update value at {}".format(this_addr))
+        # normalize once at entry, the diff loop only sees bytes-like data
+        new = _bytes_like(buf)
+
+        bpp = self._bpp
+        bpp_mask = self._bpp_mask
+
+        # process one page at a time, keeping peak RAM bounded by the page
+        # size no matter how large the update buffer is
+        offset = 0
+        while offset < len(new):
+            page_addr = addr + offset
+            page_len = min(bpp - (page_addr & bpp_mask), len(new) - offset)
+
+            old = self.read(addr=page_addr, nbytes=page_len)
+            new_page = new[offset:offset + page_len]
+
+            # unchanged page content, skip the diff scan entirely
+            if old == new_page:
+                offset += page_len
+                continue
+
+            # runs are tracked as indices into the new data and emitted as
+            # memoryview slices, no payload is copied or concatenated
+            mv_page = memoryview(new_page)
+            run_from = -1
+
+            idx = 0
+            while idx < page_len:
+                # fast path: XOR eight bytes as a single int, a zero mask
+                # means the whole window is unchanged and can be skipped
+                if idx + 8 <= page_len:
+                    mask = (int.from_bytes(old[idx:idx + 8], 'little') ^
+                            int.from_bytes(new_page[idx:idx + 8], 'little'))
+                    if mask == 0:
+                        if run_from >= 0:
+                            self.write(addr=page_addr + run_from,
+                                       buf=mv_page[run_from:idx])
+                            run_from = -1
+                        idx += 8
+                        continue
+                    window_end = idx + 8
+                else:
+                    window_end = page_len
+
+                # compare byte values as plain ints, flushing a run of
+                # differing bytes as one write per run
+                for i in range(idx, window_end):
+                    if old[i] != new_page[i]:
+                        if run_from < 0:
+                            run_from = i
+                    elif run_from >= 0:
+                        self.write(addr=page_addr + run_from,
+                                   buf=mv_page[run_from:i])
+                        run_from = -1
+                idx = window_end
+
+            if run_from >= 0:
+                self.write(addr=page_addr + run_from,
+                           buf=mv_page[run_from:page_len])
+
+            offset += page_len
 
     def wipe(self) -> None:
         """Wipe the complete EEPROM"""
-        page_buff = b'\xff' * self.bpp
+        self._last_read_addr = -1
+        self._last_read_data = b''
+
+        bpp = self._bpp
+        dev_addr = self._addr
+        ff_page = self._ff_page
+        write_mem = self._i2c.writeto_mem
         for i in range(self.pages):
-            self.write(i * self.bpp, page_buff)
+            write_mem(dev_addr, i * bpp, ff_page, addrsize=16)
+            sleep_ms(5)
 
     def print_pages(self, addr: int, nbytes: int) -> None:
         """
@@ -249,24 +366,20 @@ class EEPROM(object):
         :param      nbytes:  The number of bytes to read
         :type       nbytes:  int
         """
-        unknown_data_first_page = addr % self.bpp
-        unknown_data_last_page = self.bpp - (addr + nbytes) % self.bpp
-        if unknown_data_last_page % self.bpp == 0:
+        unknown_data_first_page = addr & self._bpp_mask
+        unknown_data_last_page = self.bpp - ((addr + nbytes) & self._bpp_mask)
+        if unknown_data_last_page & self._bpp_mask == 0:
             unknown_data_last_page = 0
 
         data = self.read(addr=addr, nbytes=nbytes)
         extended_data = (
-            b'?' * unknown_data_first_page +
+            self._pad_page[:unknown_data_first_page] +
             data +
-            b'?' * unknown_data_last_page
+            self._pad_page[:unknown_data_last_page]
         )
 
-        sliced_data = [
-            extended_data[i: i + self.bpp] for i in range(0,
-                                                          len(extended_data),
-                                                          self.bpp)
-        ]
         print('Page {:->4}: 0 {} {}'.
               format('x', '-' * (self.bpp - len(str(self.bpp))), self.bpp))
-        for idx, a_slice in enumerate(sliced_data):
-            print('Page {:->4}: {}'.format(idx, a_slice))
+        for idx, pos in enumerate(range(0, len(extended_data), self.bpp)):
+            print('Page {:->4}: {}'.
+                  format(idx, extended_data[pos:pos + self.bpp]))
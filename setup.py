@@ -36,5 +36,7 @@ setup(
     license='MIT',
     cmdclass={'sdist': sdist_upip.sdist},
     packages=['eeprom'],
+    # ship precompiled bytecode if generated with compile_mpy.py beforehand
+    package_data={'eeprom': ['*.mpy']},
     install_requires=[]
 )
@@ -9,8 +9,6 @@ import unittest
 from io import StringIO
 from unittest.mock import Mock, patch
 
-from nose2.tools import params
-
 
 class Pin(object):
     """Fake MicroPython Pin class"""
@@ -91,6 +89,13 @@ class TestEEPROM(unittest.TestCase):
         """Track function calls and the used arguments"""
         self._tracked_call_data.append({'args': args, 'kwargs': kwargs})
 
+    def _tracked_call_indexed(self, *args, **kwargs) -> None:
+        """Track function calls by index into a presized list"""
+        self._tracked_call_data[self._calls_counter] = {
+            'args': args, 'kwargs': kwargs
+        }
+        self._calls_counter += 1
+
     def test_init(self) -> None:
         """Test EEPROM init function"""
         eeprom = EEPROM()
@@ -111,55 +116,55 @@ class TestEEPROM(unittest.TestCase):
         self.assertEqual(eeprom.bpp, 64)
         # self.assertEqual(eeprom._i2c._id, 0)
 
-    @params(
-        (0x50),
-        (80),
-    )
-    def test_addr(self, addr: int) -> None:
+        with self.assertRaises(ValueError) as context:
+            EEPROM(bpp=48)
+
+        self.assertEqual(
+            str(context.exception),
+            "Bytes per page 48 is not a power of 2"
+        )
+
+    def test_addr(self) -> None:
         """Test address property"""
-        eeprom = EEPROM(addr=addr)
+        for addr in [0x50, 80]:
+            with self.subTest(addr=addr):
+                eeprom = EEPROM(addr=addr)
 
-        self.assertEqual(eeprom.addr, addr)
+                self.assertEqual(eeprom.addr, addr)
 
-    @params(
-        (128, 32, 4096),    # pages, bytes per page, total size in bytes
-        (512, 64, 32768),
-    )
-    def test_capacity(self, pages: int, bpp: int, expectation: int) -> None:
+    def test_capacity(self) -> None:
         """Test capacity property"""
-        eeprom = EEPROM(pages=pages, bpp=bpp)
+        # pages, bytes per page, total size in bytes
+        for pages, bpp, expectation in [(128, 32, 4096), (512, 64, 32768)]:
+            with self.subTest(pages=pages, bpp=bpp):
+                eeprom = EEPROM(pages=pages, bpp=bpp)
 
-        self.assertEqual(eeprom.capacity, expectation)
+                self.assertEqual(eeprom.capacity, expectation)
 
-    @params(
-        (128),
-        (512),
-    )
-    def test_pages(self, pages: int) -> None:
+    def test_pages(self) -> None:
         """Test pages property"""
-        eeprom = EEPROM(pages=pages)
+        for pages in [128, 512]:
+            with self.subTest(pages=pages):
+                eeprom = EEPROM(pages=pages)
 
-        self.assertEqual(eeprom.pages, pages)
+                self.assertEqual(eeprom.pages, pages)
 
-    @params(
-        (32),
-        (64),
-    )
-    def test_bpp(self, bpp: int) -> None:
+    def test_bpp(self) -> None:
         """Test bpp property"""
-        eeprom = EEPROM(bpp=bpp)
+        for bpp in [32, 64]:
+            with self.subTest(bpp=bpp):
+                eeprom = EEPROM(bpp=bpp)
 
-        self.assertEqual(eeprom.bpp, bpp)
+                self.assertEqual(eeprom.bpp, bpp)
 
-    @params(
-        (128, 32, 4096),    # pages, bytes per page, total size in bytes
-        (512, 64, 32768),
-    )
-    def test_length(self, pages: int, bpp: int, expectation: int) -> None:
+    def test_length(self) -> None:
         """Test length, alias for capacity, following Arduino implementation"""
-        eeprom = EEPROM(pages=pages, bpp=bpp)
+        # pages, bytes per page, total size in bytes
+        for pages, bpp, expectation in [(128, 32, 4096), (512, 64, 32768)]:
+            with self.subTest(pages=pages, bpp=bpp):
+                eeprom = EEPROM(pages=pages, bpp=bpp)
 
-        self.assertEqual(eeprom.length(), expectation)
+                self.assertEqual(eeprom.length(), expectation)
 
     def test_read(self) -> None:
         """Test reading bytes from EEPROM"""
@@ -211,6 +216,36 @@ class TestEEPROM(unittest.TestCase):
         self.assertEqual(self._tracked_call_data[0]['args'],
                          (eeprom.addr, page_addr, bytes_to_read))
 
+    def test_read_cache(self) -> None:
+        """Test repeated reads being served from the last read cache"""
+        eeprom = EEPROM(pages=128, bpp=32, i2c=self.i2c)
+
+        def mocked_i2c_read(addr: int,
+                            memaddr: int,
+                            nbytes: int,
+                            *,
+                            addrsize: int = 8) -> bytes:
+            self._tracked_call(addr, memaddr, nbytes)
+            return bytes(range(nbytes))
+
+        with patch.object(I2C, 'readfrom_mem', side_effect=mocked_i2c_read):
+            first = eeprom.read(addr=0, nbytes=10)
+            again = eeprom.read(addr=2, nbytes=4)
+
+        # second read lies inside the first one, no further I2C transaction
+        self.assertEqual(len(self._tracked_call_data), 1)
+        self.assertEqual(again, first[2:6])
+
+        # a write into the cached range invalidates the cache
+        with patch.object(I2C, 'writeto_mem', wraps=self._tracked_call):
+            eeprom.write(addr=4, buf=bytes([93]))
+
+        self._tracked_call_data = []
+        with patch.object(I2C, 'readfrom_mem', side_effect=mocked_i2c_read):
+            eeprom.read(addr=0, nbytes=10)
+
+        self.assertEqual(len(self._tracked_call_data), 1)
+
     def test_write(self) -> None:
         """Test writing bytes to EEPROM"""
         eeprom = EEPROM(pages=128, bpp=32, i2c=self.i2c)
@@ -292,15 +327,47 @@ class TestEEPROM(unittest.TestCase):
             (eeprom.addr, offset, bytes([18] * (eeprom.bpp - offset)))
         )
 
+    def test_write_str_and_list(self) -> None:
+        """Test writing string and list of int buffers to EEPROM"""
+        eeprom = EEPROM(pages=128, bpp=32, i2c=self.i2c)
+
+        with patch.object(I2C, 'writeto_mem', wraps=self._tracked_call):
+            eeprom.write(addr=0, buf='hello')
+
+        self.assertEqual(len(self._tracked_call_data), 1)
+        self.assertEqual(self._tracked_call_data[0]['args'],
+                         (eeprom.addr, 0, b'hello'))
+
+        self._tracked_call_data = []
+
+        int_list = [5, 17, 255, 9, 12, 7, 255]
+        with patch.object(I2C, 'writeto_mem', wraps=self._tracked_call):
+            eeprom.write(addr=0, buf=int_list)
+
+        self.assertEqual(len(self._tracked_call_data), 1)
+        self.assertEqual(self._tracked_call_data[0]['args'],
+                         (eeprom.addr, 0, bytes(int_list)))
+
+        # a multi-byte str is validated against its encoded length
+        eeprom = EEPROM(pages=2, bpp=32, i2c=self.i2c)
+        with self.assertRaises(ValueError) as context:
+            eeprom.write(addr=eeprom.capacity - 2, buf='éé')
+
+        self.assertEqual(
+            str(context.exception),
+            "Last data at {} does not fit into device address range {}".
+            format(eeprom.capacity + 2, eeprom.capacity)
+        )
+
     def _mocked_read_function(self, addr: int, nbytes: int = 1) -> bytes:
         """Mocked EEPROM read function"""
-        if isinstance(self._mocked_read_data[addr], bytes):
-            if nbytes == 1:
-                return self._mocked_read_data[addr]
-            else:
-                return self._mocked_read_data[addr:addr + nbytes]
-        else:
-            return self._mocked_read_data[addr: addr + nbytes].encode()
+        data = self._mocked_read_data
+        if isinstance(data, list):
+            data = b''.join(data)
+        elif isinstance(data, str):
+            data = data.encode()
+
+        return data[addr:addr + nbytes]
 
     def test_update_str(self) -> None:
         """Test updating EEPROM cell with string"""
@@ -323,9 +390,9 @@ class TestEEPROM(unittest.TestCase):
             with patch.object(I2C, 'writeto_mem', wraps=self._tracked_call):
                 eeprom.update(addr=0, buf=update_buffer)
 
-        # difference is 'w', 'o', 'd'
-        self.assertEqual(len(self._tracked_call_data), 3)
-        for idx, (addr, val) in enumerate(zip([6, 7, 10], [b'w', b'o', b'd'])):
+        # difference is 'wo' and 'd', coalesced into one write per run
+        self.assertEqual(len(self._tracked_call_data), 2)
+        for idx, (addr, val) in enumerate(zip([6, 10], [b'wo', b'd'])):
             self.assertEqual(
                 self._tracked_call_data[idx]['args'],
                 (eeprom.addr, addr, val)
@@ -352,9 +419,9 @@ class TestEEPROM(unittest.TestCase):
             with patch.object(I2C, 'writeto_mem', wraps=self._tracked_call):
                 eeprom.update(addr=0, buf=update_buffer)
 
-        # difference is 'w', 'o', 'd'
-        self.assertEqual(len(self._tracked_call_data), 3)
-        for idx, (addr, val) in enumerate(zip([6, 7, 10], [b'w', b'o', b'd'])):
+        # difference is 'wo' and 'd', coalesced into one write per run
+        self.assertEqual(len(self._tracked_call_data), 2)
+        for idx, (addr, val) in enumerate(zip([6, 10], [b'wo', b'd'])):
             self.assertEqual(
                 self._tracked_call_data[idx]['args'],
                 (eeprom.addr, addr, val)
@@ -383,24 +450,43 @@ class TestEEPROM(unittest.TestCase):
             with patch.object(I2C, 'writeto_mem', wraps=self._tracked_call):
                 eeprom.update(addr=0, buf=update_buffer)
 
-        # difference is 93, 23, 255
+        # difference is 93 and 23, 255, coalesced into one write per run
         print(self._tracked_call_data)
-        self.assertEqual(len(self._tracked_call_data), 3)
-        for idx, (addr, val) in enumerate(zip([1, 3, 4],
-                                              [b']', b'\x17', b'\xff'])):
+        self.assertEqual(len(self._tracked_call_data), 2)
+        for idx, (addr, val) in enumerate(zip([1, 3],
+                                              [b']', b'\x17\xff'])):
             self.assertEqual(
                 self._tracked_call_data[idx]['args'],
                 (eeprom.addr, addr, val)
             )
 
+    def test_update_no_change(self) -> None:
+        """Test updating EEPROM with unchanged data issues no write"""
+        eeprom = EEPROM(pages=128, bpp=32, i2c=self.i2c)
+
+        # old and new data are identical
+        self._mocked_read_data = 'hello world'
+
+        # patch the EEPROM read function with the mocked data
+        with patch.object(
+            EEPROM, 'read', side_effect=self._mocked_read_function
+        ):
+            with patch.object(I2C, 'writeto_mem', wraps=self._tracked_call):
+                eeprom.update(addr=0, buf='hello world')
+
+        self.assertEqual(len(self._tracked_call_data), 0)
+
     def test_wipe(self) -> None:
         """Test wiping EEPROM"""
         eeprom = EEPROM(pages=128, bpp=32, i2c=self.i2c)
 
-        with patch.object(I2C, 'writeto_mem', wraps=self._tracked_call):
+        # presized list, avoids growing the tracking list on every call
+        self._tracked_call_data = [None] * eeprom.pages
+        with patch.object(I2C, 'writeto_mem',
+                          wraps=self._tracked_call_indexed):
             eeprom.wipe()
 
-        self.assertEqual(len(self._tracked_call_data), 128)
+        self.assertEqual(self._calls_counter, 128)
         for idx, ele in enumerate(self._tracked_call_data):
             self.assertEqual(
                 ele['args'],